@@ -1,29 +1,86 @@
-from loguru import logger
-from utility import Utility
-from reservation import ReservationManager
+import argparse
+import sys
+import time
+from contextlib import contextmanager
 
 
-def main(run_midnight=True):
-    utils = Utility(log_file_name="biruni.log")
+class StartupProfiler:
+    """Başlangıç aşamalarının (import, yapılandırma, ilk istek) sürelerini ölçer."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.stages = []      # (aşama, süre)
+        self.milestones = []  # (olay, başlangıçtan itibaren geçen süre)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - start))
+
+    def mark(self, name):
+        self.milestones.append((name, time.perf_counter() - self.origin))
+
+    def report(self) -> str:
+        lines = ["Başlangıç profili (ms):"]
+        lines += [f"  {name:<32} {seconds * 1000:>9.1f}" for name, seconds in self.stages]
+        lines += [f"  @ {name:<30} {seconds * 1000:>9.1f}" for name, seconds in self.milestones]
+        return "\n".join(lines)
+
+
+profiler = StartupProfiler()
+
+with profiler.stage("import loguru"):
+    from loguru import logger
+with profiler.stage("import utility"):
+    from utility import Utility
+
+
+def main(run_midnight=True, fast_start=False, profile_startup=False):
+    """
+    fast_start: Menü ve zamanlama olmadan hemen çalışır, log dosyası ilk rezervasyon isteğinden sonra kurulur.
+    profile_startup: Program sonunda import ve başlatma sürelerini raporlar.
+    """
+    with profiler.stage("Utility başlatma"):
+        utils = Utility(log_file_name="biruni.log", defer_logging=fast_start)
     logger.info("------------ PROGRAM BAŞLADI ------------")
 
+    def on_first_reservation():
+        profiler.mark("ilk rezervasyon POST")
+        with profiler.stage("log dosyası kurulumu"):
+            utils.finalize_logging()
+
     # USERNAME veya PASSWORD bilgileri False (boş, None, vb.) ise çevre değişkenlerini kullan
     if not all([utils.config.get("USERNAME"), utils.config.get("PASSWORD")]):
         logger.warning("Yapılandırma dosyası kullanılmayacak, çevre değişkenleri tercih edilecek.")
 
-        credentials = utils.load_credentials()
+        try:
+            credentials = utils.load_credentials()
+        except EnvironmentError:
+            utils.finalize_logging()
+            raise
         if credentials is None:
             return
         utils.config.update(credentials)
 
     try:
-        choice = "2" if run_midnight else utils.display_menu()
+        if fast_start:
+            choice = "1"
+        else:
+            choice = "2" if run_midnight else utils.display_menu()
         if choice == "0":
             logger.info("Kullanıcı 0 seçti, programdan çıkılıyor.")
             return
 
+        # requests modülü yalnızca gerçekten istek atılacaksa yüklenir
+        with profiler.stage("import reservation"):
+            from reservation import ReservationManager
+
         utils.configure_schedule(choice)
-        reservation_manager = ReservationManager(utils.config)
+        with profiler.stage("ReservationManager başlatma"):
+            reservation_manager = ReservationManager(utils.config, on_first_reservation)
         reservation_manager.start_reservations()
         # reservation_manager.cancel_all_reservations()
 
@@ -35,7 +92,20 @@ def main(run_midnight=True):
         logger.error(f"Ana programda hata oluştu: {e}")
     finally:
         logger.info("------------ PROGRAM SONLANDI ------------")
+        utils.finalize_logging()  # Rezervasyon isteği atılmadıysa biriken logları yine de dosyaya yaz
+        if profile_startup:
+            print(profiler.report(), file=sys.stderr)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Biruni Öğrenci İstasyonu randevu alıcı")
+    parser.add_argument("--now", action="store_true",
+                        help="Gece yarısını beklemeden hemen çalıştır (hızlı başlangıç, tek seferlik çalışma)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Import ve başlatma sürelerini program sonunda raporla")
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    main(run_midnight=True)
\ No newline at end of file
+    args = parse_args()
+    main(run_midnight=True, fast_start=args.now, profile_startup=args.profile_startup)
@@ -127,9 +127,11 @@ class TelegramBot:
 
 class ReservationManager:
 
-    def __init__(self, config):
+    def __init__(self, config, on_first_reservation=None):
         self.config = config
         self.headers = None
+        # İlk rezervasyon POST isteği gönderildikten sonra bir kez çağrılır (ör. ertelenmiş log kurulumu)
+        self.on_first_reservation = on_first_reservation
         self.telegram_bot = None
         if config.get("TELEGRAM_TOKEN") and config.get("TELEGRAM_ID"):
             self.telegram_bot = TelegramBot(token=config["TELEGRAM_TOKEN"], chat_id=config["TELEGRAM_ID"])
@@ -331,9 +333,18 @@ class ReservationManager:
             logger.error(f"Rezervasyon oluşturulamadı: {e}")
         except Exception as e:
             logger.error(f"Unexpected error while creating reservation: {e}")
+        finally:
+            self._notify_first_reservation()
         return False
 
 
+    def _notify_first_reservation(self):
+        """İlk rezervasyon isteğinden sonra on_first_reservation'ı bir kez çağırır."""
+        callback, self.on_first_reservation = self.on_first_reservation, None
+        if callback:
+            callback()
+
+
     def create_reservation_for_seats(self, date):
         """Belirli bir tarih için koltuk rezervasyonu dener ve sonucu kaydeder."""
         logger.info(f"{date} tarihi için rezervasyon denemesi başlıyor...")
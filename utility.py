@@ -6,23 +6,38 @@ import sys
 import json
 import time
 import datetime
+import functools
 from pathlib import Path
 from loguru import logger
 
 
 class Utility:
 
-    def __init__(self, log_file_name="utility.log"):
-        self.configure_loguru(log_file_name)  # Logger'ı belirtilen dosya adıyla yapılandır
+    def __init__(self, log_file_name="utility.log", defer_logging=False):
+        self.log_file_name = log_file_name
+        self._log_buffer = None
+        if defer_logging:
+            # Dosya handler'ı ilk rezervasyon isteğinden sonra kurulur, o zamana kadar loglar bellekte tutulur
+            self._log_buffer = Utility.buffer_loguru()
+        else:
+            self.configure_loguru(log_file_name)  # Logger'ı belirtilen dosya adıyla yapılandır
         self.directory = Utility.get_working_directory()
         self.config_path = self.directory / "config.json"
         self.config = Utility.load_config(self.config_path)
-        logger.debug(f"Çalışma dizini: {self.directory}")
-        logger.debug(f"Yapılandırma: {self.config}")
+        logger.debug("Çalışma dizini: {}", self.directory)
+        logger.debug("Yapılandırma anahtarları: {}", list(self.config))
+
+    def finalize_logging(self):
+        """Ertelenmiş log yapılandırmasını tamamlar ve bellekteki logları dosyaya aktarır."""
+        if self._log_buffer is None:
+            return
+        backlog, self._log_buffer = self._log_buffer, None
+        Utility.configure_loguru(self.log_file_name, backlog)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_working_directory() -> Path:
-        """Uygulamanın çalıştığı yolu Path objesi olarak döndürür."""
+        """Uygulamanın çalıştığı yolu Path objesi olarak döndürür. Sonuç önbelleğe alınır."""
         logger.debug("Çalışma dizini belirleniyor.")
         if getattr(sys, 'frozen', False):
             path = Path(sys.executable).parent
@@ -52,16 +67,33 @@ class Utility:
 
 
     @staticmethod
-    def configure_loguru(file_name):
-        """ Loglama yapılandırmasını başlatır."""
+    def configure_loguru(file_name, backlog=()):
+        """ Loglama yapılandırmasını başlatır.
+        backlog: buffer_loguru ile bellekte biriktirilen ve dosyaya aktarılacak mesajlar.
+        """
         file_path = Utility.get_working_directory() / file_name
-        
+
         # Tüm mevcut handler'ları kaldır
         logger.remove()
-        # Terminalde logları göstermek için
-        logger.add(sys.stderr, level="WARNING")
-        # Aynı zamanda logları bir dosyaya yazmak için
+        # Logları bir dosyaya yazmak için
         logger.add(file_path, backtrace=True, rotation="10 MB", compression="zip", level="INFO")
+        # Biriken mesajlar terminale zaten yazıldı, bu yüzden terminal handler'ından önce aktarılır
+        for message in backlog:
+            logger.opt(raw=True).log(message.record["level"].name, str(message))
+        # Aynı zamanda logları terminalde göstermek için
+        logger.add(sys.stderr, level="WARNING")
+
+
+    @staticmethod
+    def buffer_loguru() -> list:
+        """ Dosya handler'ı kurmadan loglamayı başlatır.
+        INFO ve üzeri mesajlar döndürülen listede biriktirilir, configure_loguru ile dosyaya aktarılır.
+        """
+        backlog = []
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+        logger.add(backlog.append, backtrace=True, level="INFO")
+        return backlog
 
 
     @staticmethod